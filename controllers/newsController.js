@@ -13,7 +13,6 @@ const { analyzeWithMLModel } = require('../services/newsAnalyzer'); // Import th
 // Submit news for analysis
 const analyzeNews = async (req, res) => {
     try {
-        console.log('Incoming request body:', req.body); // Log the request body
         let { title, content, sourceUrl } = req.body;
 
         // If title and content are missing, extract them from the source URL
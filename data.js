@@ -9,7 +9,7 @@ const sensationalWords = [
     'world-ending', 'legendary', 'too good to be true', 'never-before-seen', 'the truth behind', 
     'history in the making', 'you are being lied to', 'secrets revealed', 'mind control', 
     'trapped', 'wake up', 'urgent', 'emergency', 'leaked', 'world will never be the same', 
-    'vanished', 'uncovered', 'mysterious', 'groundbreaking', 'freaky', 'twisted', 'terrifying', 
+    'vanished', 'uncovered', 'mysterious', 'groundbreaking', 'freaky', 'twisted', 
     'you have been warned', 'conclusive proof', 'biggest lie ever', 'history rewritten', 
     'cover-up', 'banned', 'censored', 'forbidden knowledge', 'scary', 'panic', 'the most', 
     'sweeping changes', 'hidden dangers', 'unprecedented', 'never told before', 'unfiltered', 
@@ -35,7 +35,7 @@ const sensationalWords = [
     'this changes everything', 'everything you know is wrong', 'this explains everything',
     'connecting the dots', 'follow the money', 'stop the steal', 'rigged',
     'making a killing', 'psychological operation', 'psyop', 'brainwashing',
-    'mind control', 'predictive programming', 'constitutional crisis',
+    'predictive programming', 'constitutional crisis',
     'constitutional emergency', 'silent majority', 'silent war', 'information war'
 ];
 
@@ -74,7 +74,7 @@ const scientificWords = [
     'phylogeography', 'ethology', 'behavioral ecology', 'circadian rhythm',
     'chronobiology', 'psychophysics', 'operant conditioning', 'neurochemistry',
     'pharmacodynamics', 'pharmacokinetics', 'pharmacogenomics', 'bioavailability',
-    'bioinformatics', 'computational biology', 'systems biology', 'synthetic genomics',
+    'computational biology', 'systems biology', 'synthetic genomics',
     'genetic algorithm', 'neural network architecture', 'convolutional neural network',
     'recursive neural network', 'backpropagation', 'gradient descent',
     'reinforcement learning', 'unsupervised learning', 'supervised learning',
@@ -100,40 +100,40 @@ const positiveWords = [
     'charitable', 'heartwarming', 'nurturing', 'gentle', 'forgiving', 'sympathetic', 'supportive', 'altruistic', 'encouraging', 'gracious',
     'successful', 'accomplished', 'achieved', 'victorious', 'prosperous', 'thriving', 'empowered', 'capable', 'resilient', 'determined', 
     'unstoppable', 'goal-oriented', 'ambitious', 'motivated', 'inspired', 'passionate', 'driven', 'focused', 'disciplined', 'committed',
-    'loving', 'romantic', 'devoted', 'affectionate', 'caring', 'trusting', 'faithful', 'companionate', 'soulmate', 'intimate', 
-    'cherished', 'adored', 'beloved', 'tender', 'heartfelt', 'devoted', 'harmonious', 'united', 'supportive', 'loyal',
-    'optimistic', 'hopeful', 'confident', 'reassuring', 'bright', 'uplifting', 'inspiring', 'motivational', 'encouraging', 'cheerful', 
+    'loving', 'romantic', 'devoted', 'affectionate', 'trusting', 'faithful', 'companionate', 'soulmate', 'intimate', 
+    'cherished', 'adored', 'beloved', 'tender', 'heartfelt', 'harmonious', 'united', 'loyal',
+    'optimistic', 'hopeful', 'confident', 'reassuring', 'bright', 'uplifting', 'inspiring', 'motivational', 
     'enthusiastic', 'spirited', 'buoyant', 'positive', 'vivacious', 'effervescent', 'invigorating', 'stimulating', 'refreshing', 'empowering',
-    'brilliant', 'ingenious', 'insightful', 'wise', 'thoughtful', 'innovative', 'visionary', 'creative', 'original', 'artistic', 
-    'imaginative', 'resourceful', 'perceptive', 'intuitive', 'intellectual', 'inspiring', 'pioneering', 'revolutionary', 'bright-minded', 'clever',
-    'strong', 'courageous', 'bold', 'fearless', 'valiant', 'brave', 'resilient', 'tenacious', 'determined', 'unwavering', 
-    'steadfast', 'indomitable', 'unstoppable', 'heroic', 'persistent', 'gutsy', 'daring', 'adventurous', 'undaunted', 'unshakable',
+    'ingenious', 'insightful', 'wise', 'innovative', 'visionary', 'creative', 'original', 'artistic', 
+    'imaginative', 'resourceful', 'perceptive', 'intuitive', 'intellectual', 'pioneering', 'revolutionary', 'bright-minded', 'clever',
+    'strong', 'courageous', 'bold', 'fearless', 'valiant', 'brave', 'tenacious', 'unwavering', 
+    'steadfast', 'indomitable', 'heroic', 'persistent', 'gutsy', 'daring', 'adventurous', 'undaunted', 'unshakable',
     'healthy', 'vibrant', 'energetic', 'fit', 'robust', 'rejuvenated', 'refreshed', 'restored', 'balanced', 'nourished', 
     'whole', 'pure', 'detoxified', 'healing', 'revitalized', 'active', 'agile', 'dynamic', 'flourishing', 'invigorated',
-    'blooming', 'lush', 'verdant', 'majestic', 'serene', 'tranquil', 'peaceful', 'picturesque', 'radiant', 'golden', 
-    'glowing', 'heavenly', 'breezy', 'crisp', 'fresh', 'pristine', 'soothing', 'harmonious', 'sparkling', 'illuminated',
-    'fortunate', 'blessed', 'lucky', 'prosperous', 'wealthy', 'bountiful', 'abundant', 'rich', 'thriving', 'rewarding', 
-    'windfall', 'serendipitous', 'flourishing', 'opportune', 'golden opportunity', 'favorable', 'booming', 'success-laden', 'fruitful', 'rewarding',
-    'flourishing', 'resplendent', 'praiseworthy', 'commendable', 'meritorious',
+    'blooming', 'lush', 'verdant', 'majestic', 'picturesque', 'golden', 
+    'glowing', 'heavenly', 'breezy', 'crisp', 'fresh', 'pristine', 'soothing', 'sparkling', 'illuminated',
+    'fortunate', 'blessed', 'lucky', 'wealthy', 'bountiful', 'abundant', 'rich', 'rewarding', 
+    'windfall', 'serendipitous', 'opportune', 'golden opportunity', 'favorable', 'booming', 'success-laden', 'fruitful', 
+    'resplendent', 'praiseworthy', 'commendable', 'meritorious',
     'sublime', 'transcendent', 'ethical', 'principled', 'virtuous', 'honorable',
     'respectful', 'dignified', 'genuine', 'authentic', 'integrity', 'respectable',
     'acclaimed', 'esteemed', 'revered', 'venerated', 'exalted', 'elevated',
     'marvelous', 'wondrous', 'enchanting', 'captivating', 'mesmerizing',
     'fascinating', 'enthralling', 'spellbinding', 'bewitching', 'alluring',
-    'attractive', 'pleasing', 'favorable', 'gratifying', 'satisfying',
-    'rewarding', 'fulfilling', 'engaging', 'compelling', 'conducive',
+    'attractive', 'pleasing', 'gratifying', 'satisfying',
+    'fulfilling', 'engaging', 'compelling', 'conducive',
     'promising', 'auspicious', 'propitious', 'beneficial', 'advantageous',
-    'fortunate', 'miraculous', 'proficient', 'adept', 'masterful', 'skillful',
-    'accomplished', 'diligent', 'prudent', 'knowledgeable', 'insightful',
+    'miraculous', 'proficient', 'adept', 'masterful', 'skillful',
+    'diligent', 'prudent', 'knowledgeable', 
     'rational', 'reasonable', 'logical', 'coherent', 'sound', 'sensible',
-    'balanced', 'pragmatic', 'practical', 'effective', 'efficacious',
+    'pragmatic', 'practical', 'effective', 'efficacious',
     'productive', 'constructive', 'improvement', 'enhancement', 'enrichment',
-    'authentic', 'genuine', 'refined', 'exquisite', 'elegant', 'graceful',
-    'sophisticated', 'tasteful', 'discerning', 'perceptive', 'astute',
+    'refined', 'exquisite', 'elegant', 'graceful',
+    'sophisticated', 'tasteful', 'discerning', 'astute',
     'appreciative', 'responsive', 'attentive', 'cooperative', 'accommodating',
     'receptive', 'open-minded', 'tolerant', 'accepting', 'inclusive',
-    'respectful', 'courteous', 'cordial', 'amiable', 'affable', 'congenial',
-    'wholesome', 'nourishing', 'nutritious', 'beneficial', 'therapeutic'
+    'courteous', 'cordial', 'amiable', 'affable', 'congenial',
+    'wholesome', 'nourishing', 'nutritious', 'therapeutic'
 ];
 
 const negativeWords = [
@@ -150,7 +150,7 @@ const negativeWords = [
     'unfortunate', 'accident', 'calamity', 'chaotic', 'tumultuous', 'unstable', 'fraudulent', 
     'malicious', 'heinous', 'atrocious', 'vile', 'slanderous', 'insulting', 'offensive', 
     'degrading', 'humiliating', 'disrespectful', 'intolerable', 'unfair', 'harsh', 'rigid', 
-    'oppressive', 'brutal', 'ruthless', 'merciless', 'unjust', 'criminal', 'illegal', 
+    'brutal', 'ruthless', 'merciless', 'unjust', 'criminal', 'illegal', 
     'illicit', 'scam', 'deception', 'treason', 'violation', 'trespassing', 'abnormal', 
     'disturbing', 'unnatural', 'repulsive', 'disgusting', 'nauseating', 'putrid', 'vulgar', 
     'cruel', 'barbaric', 'savage', 'monster', 'beastly', 'horrendous', 'wicked', 'sinister', 
@@ -159,9 +159,9 @@ const negativeWords = [
     'destitute', 'bankrupt', 'unemployed', 'penniless', 'helpless', 'weak', 'vulnerable', 
     'exhausted', 'burnout', 'overwhelmed', 'burden', 'stress', 'pressure', 'anxiety', 
     'panic', 'fear', 'paranoia', 'nightmare', 'hysteria', 'delirium', 'insanity', 'madness', 
-    'deranged', 'psychotic', 'unstable', 'schizophrenic', 'paralyzed', 'crippled', 'disabled', 
+    'deranged', 'psychotic', 'schizophrenic', 'paralyzed', 'crippled', 'disabled', 
     'deformed', 'mutated', 'horrid', 'hideous', 'ghastly', 'grotesque', 'dismal', 'gloomy', 
-    'shadowy', 'sinister', 'foreboding', 'menacing', 'ominous', 'danger', 'peril', 'precarious', 
+    'shadowy', 'foreboding', 'menacing', 'ominous', 'danger', 'peril', 'precarious', 
     'volatile', 'deadly', 'lethal', 'murderous', 'suicidal', 'homicidal', 'execution', 
     'massacre', 'genocide', 'war', 'battle', 'bloodshed', 'torture', 'torment', 'agony', 
     'anguish', 'pain', 'injury', 'wound', 'scarred', 'bruised', 'broken', 'shattered', 
@@ -171,30 +171,30 @@ const negativeWords = [
     'screaming', 'yelling', 'ranting', 'raging', 'furious', 'fuming', 'boiling', 'exploding', 
     'detonated', 'eruption', 'earthquake', 'hurricane', 'tornado', 'tsunami', 'flood', 
     'drought', 'blizzard', 'fire', 'inferno', 'burning', 'charred', 'scorched', 'ashes', 
-    'annihilation', 'obliteration', 'eradication', 'extermination', 'execution', 'guillotine', 
+    'annihilation', 'obliteration', 'eradication', 'extermination', 'guillotine', 
     'lynching', 'beheading', 'assassination', 'bombing', 'terrorism', 'hostage', 'kidnapping', 
     'ransom', 'trafficking', 'enslavement', 'abduction', 'extortion', 'blackmail', 'corruption', 
     'bribery', 'embezzlement', 'scandal', 'collusion', 'conspiracy', 'manipulation', 'brainwashing',
     'despicable', 'reprehensible', 'contemptible', 'deplorable', 'inexcusable',
-    'unforgivable', 'intolerable', 'unbearable', 'insufferable', 'unspeakable',
+    'unforgivable', 'unbearable', 'insufferable', 'unspeakable',
     'unethical', 'immoral', 'depraved', 'perverted', 'degenerate', 'debased',
-    'debauched', 'dissolute', 'unprincipled', 'iniquitous', 'sinful', 'malicious',
+    'debauched', 'dissolute', 'unprincipled', 'iniquitous', 'sinful', 
     'spiteful', 'vindictive', 'venomous', 'vitriolic', 'acrimonious', 'belligerent',
-    'contemptuous', 'demeaning', 'disparaging', 'disrespectful', 'ridiculing',
+    'contemptuous', 'demeaning', 'disparaging', 'ridiculing',
     'mocking', 'taunting', 'belittling', 'condescending', 'patronizing',
     'denigrating', 'defaming', 'slandering', 'calumniating', 'libeling',
     'smearing', 'defiling', 'contaminating', 'tainting', 'defacing',
-    'profaning', 'desecrating', 'violating', 'transgressing', 'defiling',
-    'depressing', 'disheartening', 'discouraging', 'dispiriting', 'deflating',
-    'demoralizing', 'disheartening', 'disenchanting', 'disillusioning',
+    'profaning', 'desecrating', 'violating', 'transgressing', 
+    'disheartening', 'discouraging', 'dispiriting', 'deflating',
+    'demoralizing', 'disenchanting', 'disillusioning',
     'disappointing', 'frustrating', 'disorienting', 'dismaying', 'distressing',
-    'disturbing', 'unsettling', 'perturbing', 'alarming', 'frightening',
+    'unsettling', 'perturbing', 'alarming', 'frightening',
     'terrifying', 'petrifying', 'horrific', 'nasty', 'foul', 'loathsome',
-    'repugnant', 'abhorrent', 'detestable', 'sickening', 'nauseating',
+    'repugnant', 'abhorrent', 'detestable', 'sickening', 
     'irrelevant', 'meaningless', 'insignificant', 'trivial', 'frivolous',
     'pointless', 'futile', 'fruitless', 'worthless', 'useless', 'ineffective',
     'ineffectual', 'incompetent', 'inept', 'unprofessional', 'substandard',
-    'mediocre', 'inadequate', 'deficient', 'faulty', 'flawed', 'impaired'
+    'mediocre', 'deficient', 'faulty', 'flawed', 'impaired'
 ];
 
 const leftBiasWords = [
@@ -256,18 +256,18 @@ const leftBiasWords = [
     'un peacekeeping', 'humanitarian intervention', 'open borders',
     'sanctuary cities', 'immigrant rights', 'path to citizenship', 'dreamers',
     'undocumented immigrants', 'refugee resettlement', 'asylum seekers',
-    'universal healthcare', 'medicare for all', 'single-payer system',
+    'medicare for all', 'single-payer system',
     'public option', 'affordable care act', 'food stamps', 'housing subsidies',
     'eviction moratorium', 'rent control', 'tuition-free college',
-    'student loan forgiveness', 'progressive taxation', 'wealth tax',
+    'student loan forgiveness', 
     'billionaire tax', 'capital gains tax', 'estate tax', 'corporate regulations',
     'wall street regulations', 'consumer protections', 'labor organizing',
     'unions', 'collective bargaining', 'workers cooperatives', 'fair trade',
-    'climate justice', 'environmental justice', 'green new deal',
+    'climate justice', 'green new deal',
     'renewable transition', 'carbon neutrality', 'climate reparations',
     'indigenous land rights', 'vaccine equity', 'equitable healthcare access',
-    'universal basic income', 'living wage', 'guaranteed income', 'wealth redistribution',
-    'democratic socialism', 'eco-socialism', 'anti-fascism', 'anti-racism'
+    'living wage', 'guaranteed income', 
+    'eco-socialism', 'anti-racism'
 ];
 
 const rightBiasWords = [
@@ -316,27 +316,27 @@ const rightBiasWords = [
     'states rights', 'constitutional originalism', 'strict constructionism',
     'constitutional conservatism', 'second amendment rights', 'gun ownership',
     'stand your ground', 'castle doctrine', 'law and order', 'tough on crime',
-    'mandatory minimums', 'police support', 'blue lives matter', 'border security',
+    'mandatory minimums', 'police support', 'blue lives matter', 
     'illegal immigration', 'illegal aliens', 'border wall', 'deportation',
-    'extreme vetting', 'travel ban', 'america first', 'economic nationalism',
+    'extreme vetting', 'travel ban', 'america first', 
     'trade protectionism', 'tariffs', 'military strength', 'strong military',
     'defense spending', 'national defense', 'patriotism', 'flag respect',
     'american exceptionalism', 'western civilization', 'judeo-christian values',
-    'religious liberty', 'religious freedom', 'pro-life', 'right to life',
+    'religious liberty', 'pro-life', 
     'sanctity of life', 'traditional marriage', 'family values', 'parental rights',
     'school choice', 'charter schools', 'voucher system', 'homeschooling',
     'anti-critical race theory', 'merit-based', 'color-blind society',
-    'anti-affirmative action', 'self-reliance', 'personal responsibility',
+    'anti-affirmative action', 'personal responsibility',
     'bootstraps', 'work ethic', 'welfare reform', 'entitlement reform',
-    'market solutions', 'privatization', 'rugged individualism', 'big government',
+    'market solutions', 'rugged individualism', 'big government',
     'government overreach', 'regulatory burden', 'tax burden', 'nanny state',
     'big tech censorship', 'cancel culture', 'political correctness',
-    'free speech rights', 'anti-socialism', 'anti-marxism', 'radical left',
-    'liberal media', 'fake news', 'media bias', 'coastal elites',
+    'free speech rights', 'anti-marxism', 
+    'liberal media', 'fake news', 'coastal elites',
     'silent majority', 'main street', 'real america', 'heartland values',
     'rural values', 'american sovereignty', 'energy independence',
     'fossil fuels', 'clean coal', 'oil drilling', 'american energy',
-    'pro-business', 'job growth', 'economic freedom', 'opportunity zones',
+    'job growth', 'economic freedom', 'opportunity zones',
     'school prayer', 'faith-based initiatives', 'culture war', 'traditional values',
     'anti-globalism', 'anti-establishment', 'drain the swamp', 'deep state'
 ];
@@ -349,7 +349,7 @@ const stopWords = [
     'over', 'under', 'more', 'less', 'very', 'some', 'any', 'all', 'most', 
     'many', 'few', 'such', 'only', 'own', 'same', 'other', 'than', 'too', 
     'much', 'how', 'when', 'where', 'why', 'what', 'who', 'whom', 'whose', 
-    'which', 'because', 'while', 'though', 'although', 'before', 'after', 
+    'because', 'while', 'though', 'although', 'before', 'after', 
     'during', 'between', 'within', 'without', 'against', 'through', 
     'each', 'every', 'either', 'neither', 'both', 'one', 'two', 'three', 
     'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten'
@@ -593,6 +593,57 @@ const sourceReputationData = {
     'clickbaitnews.top': { reliability: 15, bias: 0, factChecking: 1, editorialStandards: 1, transparency: 1 }
   
   };
+// Static fact-checking guidance returned with every analysis, built once at load
+const educationalResources = {
+    quickTips: [
+      'Check the source\'s credibility',
+      'Look for unusual URLs or site names',
+      'Check the article\'s date and author',
+      'Watch for emotional language',
+      'Verify with fact-checking sites'
+    ],
+    guides: [
+      {
+        title: 'Source Evaluation',
+        tips: [
+          {
+            title: 'Check the Domain',
+            description: 'Verify if the website is legitimate and well-known'
+          },
+          {
+            title: 'Author Credentials',
+            description: 'Research the author\'s background and expertise'
+          }
+        ]
+      },
+      {
+        title: 'Content Analysis',
+        tips: [
+          {
+            title: 'Cross-Reference',
+            description: 'Verify the information with other reliable sources'
+          },
+          {
+            title: 'Check Dates',
+            description: 'Ensure the content is current and relevant'
+          }
+        ]
+      }
+    ],
+    recommendedResources: [
+      {
+        title: 'Fact-Checking Websites',
+        description: 'Popular fact-checking resources',
+        url: 'https://www.snopes.com'
+      },
+      {
+        title: 'Media Bias Chart',
+        description: 'Understanding news source biases',
+        url: 'https://www.adfontesmedia.com'
+      }
+    ]
+};
+
 module.exports={
     rightBiasWords,
     leftBiasWords,
@@ -602,5 +653,6 @@ module.exports={
     sensationalWords,
     stopWords,
     fakePhrases,
-    sourceReputationData
+    sourceReputationData,
+    educationalResources
 };
\ No newline at end of file
@@ -7,246 +7,315 @@ const cheerio = require('cheerio');
 const sourceService = require('../services/sourceData');
 const analyzer = require('../services/analyzer');
 const newsAnalyzer = require('../services/newsAnalyzer');
+const { educationalResources } = require('../data');
 
-// Main analysis endpoint
-router.post('/analyze', async (req, res) => {
-  try {
-    const { url, title, content } = req.body;
-    let analysisText = '';
-    let originalTitle = title || '';
-    let sourceDomain = null;
-
-    // Extract content from URL if provided
-    if (url) {
-      try {
-        const response = await axios.get(url);
-        const $ = cheerio.load(response.data);
-        
-        
-        // Try to extract title if not provided
-        if (!originalTitle) {
-          originalTitle = $('meta[property="og:title"]').attr('content') || 
-                        $('title').text() || 
-                        url;
-        }
-        // console.log("originalTitle is " + JSON.stringify(originalTitle));
-        // console.log("originalTitle is " + JSON.stringify(originalTitle));
-        
-        // Extract content using more robust selectors
-        analysisText = $('article').text() || 
-                      $('main').text() || 
-                      $('.content').text() || 
-                      $('p').text().substring(0, 5000) || 
-                      $('body').text().substring(0, 2000);
-
-        // console.log("analysisText is " + JSON.stringify(analysisText));
-                      
-        sourceDomain = sourceService.extractDomain(url);
-        // console.log("sourceDomain is " + sourceDomain);
-        // console.log("sourceDomain is " + sourceDomain);
-      } catch (error) {
-        // console.error('Error fetching URL:', error);
-        // console.error('Error fetching URL:', error);
+// Factual indicator patterns, compiled once at module load
+const NUMBER_REGEX = /\d+(\.\d+)?(\s*%)?/g;
+const QUOTE_REGEX = /["'""].*?["'""]/g;
+const MONTH_DATE_REGEX = /\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?\b/gi;
+const ATTRIBUTION_REGEX = /according to|said|reported|stated|according|source/gi;
+
+// Fixed parts of the analysis response, shared across requests instead of allocated for each one
+const EMPTY_LIST = Object.freeze([]);
+const EMPTY_OBJECT = Object.freeze({});
+const DEFAULT_KNOWN_FOR = Object.freeze(['General News Coverage']);
+const LOW_CREDIBILITY_RED_FLAGS = Object.freeze(['Source has low credibility rating']);
+
+// Each batch item makes its own ML and scraping requests, so batches are kept small
+const MAX_BATCH_ITEMS = 20;
+
+// Helper function to run the full analysis for one article, shared by the single and batch endpoints
+const analyzeArticle = async ({ url, title, content }) => {
+  let analysisText = '';
+  let originalTitle = title || '';
+  let sourceDomain = null;
+
+  // Extract content from URL if provided
+  if (url) {
+    try {
+      const response = await axios.get(url);
+      const $ = cheerio.load(response.data);
+      
+      
+      // Try to extract title if not provided
+      if (!originalTitle) {
+        originalTitle = $('meta[property="og:title"]').attr('content') || 
+                      $('title').text() || 
+                      url;
       }
+      // console.log("originalTitle is " + JSON.stringify(originalTitle));
+      // console.log("originalTitle is " + JSON.stringify(originalTitle));
+      
+      // Extract content using more robust selectors
+      analysisText = $('article').text() || 
+                    $('main').text() || 
+                    $('.content').text() || 
+                    $('p').text().substring(0, 5000) || 
+                    $('body').text().substring(0, 2000);
+
+      // console.log("analysisText is " + JSON.stringify(analysisText));
+                    
+      sourceDomain = sourceService.extractDomain(url);
+      // console.log("sourceDomain is " + sourceDomain);
+      // console.log("sourceDomain is " + sourceDomain);
+    } catch (error) {
+      // console.error('Error fetching URL:', error);
+      // console.error('Error fetching URL:', error);
     }
-   
-    // Use provided content if URL extraction failed or wasn't provided
-    if (!analysisText) {
-      analysisText = content || originalTitle || '';
-    }
+  }
+ 
+  // Use provided content if URL extraction failed or wasn't provided
+  if (!analysisText) {
+    analysisText = content || originalTitle || '';
+  }
 
-    // Get source credibility data
-    const sourceData = sourceService.getSourceCredibility(sourceDomain);
-    
-    // Generate sentiment analysis
-    const sentiment = await newsAnalyzer.analyzeWithMLModel(url, originalTitle, analysisText);
-    
-    // Extract key terms
-    const keyTerms = analyzer.extractKeyTerms(analysisText);
-    
-    // Calculate language score
-    const languageScore = analyzer.calculateLanguageScore(analysisText);
+  // Get source credibility data
+  const sourceData = sourceService.getSourceCredibility(sourceDomain);
+  
+  // Generate sentiment analysis and fake news detection - the two ML services are independent,
+  // so query them concurrently instead of waiting for one before calling the other
+  const [sentiment, FakeNews] = await Promise.all([
+    newsAnalyzer.analyzeWithMLModel(url, originalTitle, analysisText),
+    newsAnalyzer.fakeNews(url, originalTitle, analysisText)
+  ]);
+  
+  // Tokenize the text once and share the tokens between the scorers below
+  const analysisWords = analyzer.tokenizer.tokenize(analysisText.toLowerCase());
+  
+  // Extract key terms
+  const keyTerms = analyzer.extractKeyTerms(analysisText, analysisWords);
+  
+  // Calculate language score
+  const languageScore = analyzer.calculateLanguageScore(analysisText, analysisWords);
+  
+  // Calculate bias
+  const biasScore = analyzer.calculateBias(analysisText, analysisWords);
+  
+  // Generate mock social media metrics based on source reputation
+  const socialMetrics = sourceService.generateSocialMetrics(sourceData, originalTitle);
+  
+  // Calculate credibility score based on source reliability
+  let credibilityScore = sourceData.reliability;
+  
+  // Apply structural and writing quality analysis for unknown sources
+  // that haven't been identified as suspicious
+  if (sourceData.reliability >= 40 && sourceData.reliability <= 70) {
+    // For sources that aren't clearly identified as high or low quality,
+    // analyze content structure and coherence
+    // Lowercase the text once and share it between tokenization and coherence analysis
+    const qualityText = content || analysisText;
+    const lowerQualityText = qualityText.toLowerCase();
+    const structuralScore = newsAnalyzer.analyzeStructuralElements(qualityText);
+    const words = analyzer.tokenizer.tokenize(lowerQualityText);
+    const coherenceScore = newsAnalyzer.analyzeTextCoherence(words, lowerQualityText);
     
-    // Calculate bias
-    const biasScore = analyzer.calculateBias(analysisText);
+    // console.log(`Content quality analysis: structural: ${structuralScore}, coherence: ${coherenceScore}`);
     
-    // Generate mock social media metrics based on source reputation
-    const socialMetrics = sourceService.generateSocialMetrics(sourceData, originalTitle);
+    // Adjust credibility score for unknown sources based on content quality
+    const contentQualityScore = (structuralScore * 0.5) + (coherenceScore * 0.5);
+    const contentWeight = 0.4;
+    const sourceWeight = 0.6;
     
-    // Calculate credibility score based on source reliability
-    let credibilityScore = sourceData.reliability;
+    credibilityScore = (credibilityScore * sourceWeight) + (contentQualityScore * contentWeight);
+  }
+  
+  // For highly credible sources, keep score high
+  if (sourceData.reliability >= 85) {
+    credibilityScore = Math.max(credibilityScore, 85);
+  }
+  
+  // For less credible sources, ALWAYS keep score lower than 40
+  if (sourceData.reliability < 50) {
+    credibilityScore = Math.min(40, credibilityScore);
+  }
+  
+  // Round the credibility score for consistency
+  credibilityScore = Math.round(credibilityScore);
+  let positivesrc = (sentiment.sentiment == 'positive') ? sentiment.probability : 0;
+  let negativesrc = (sentiment.sentiment == 'negative') ? sentiment.probability : 0;
+
+  // Readability is reported in two places; compute it once
+  const readabilityLevel = getReadabilityLevel(analysisText);
 
-    let FakeNews = await newsAnalyzer.fakeNews(url, originalTitle, analysisText);
+  // Generate comprehensive analysis results
+  const result = {
+    // Credibility metrics
     
-    // Apply structural and writing quality analysis for unknown sources
-    // that haven't been identified as suspicious
-    if (sourceData.reliability >= 40 && sourceData.reliability <= 70) {
-      // For sources that aren't clearly identified as high or low quality,
-      // analyze content structure and coherence
-      const structuralScore = newsAnalyzer.analyzeStructuralElements(content || analysisText);
-      const words = analyzer.tokenizer.tokenize((content || analysisText).toLowerCase());
-      const coherenceScore = newsAnalyzer.analyzeTextCoherence(words, (content || analysisText).toLowerCase());
-      
-      // console.log(`Content quality analysis: structural: ${structuralScore}, coherence: ${coherenceScore}`);
-      
-      // Adjust credibility score for unknown sources based on content quality
-      const contentQualityScore = (structuralScore * 0.5) + (coherenceScore * 0.5);
-      const contentWeight = 0.4;
-      const sourceWeight = 0.6;
-      
-      credibilityScore = (credibilityScore * sourceWeight) + (contentQualityScore * contentWeight);
+   
+    fakeProbability : 100-FakeNews.confidence*90, 
+  isLikelyFake : (FakeNews.prediction == 'Fake' && FakeNews.confidence > 50) ? true : false,
+  confidence :FakeNews.confidence*85,
+  contentType : 'NEWS',
+  keyFeatures : EMPTY_LIST,
+  readabilityMetrics : readabilityLevel,
+  patternAnalysis : EMPTY_OBJECT,
+  message : FakeNews.title,
+    sourceReliability: sourceData.reliability,
+    credibilityScore: credibilityScore,
+    languageScore: languageScore,
+
+     sentiment: {
+      positive: positivesrc,
+      negative: negativesrc,
+      neutral: sentiment.probability,
+      tone: sentiment.sentiment
+  },
+    contentScore: Math.min(sourceData.reliability + 10, 100),
+    factScore: Math.min(sourceData.reliability + (sourceData.factChecking * 5), 100),
+    // Verification status
+    verificationStatus: analyzer.getVerificationStatus(credibilityScore),
+
+    // Bias and sentiment
+    bias: sourceData.bias,
+    biasScore: biasScore,
+    biasLevel: analyzer.getBiasLevel(biasScore),
+    sentiment,
+
+    // Source information
+    source: sourceDomain || 'Unknown Source',
+    sourceUrl: url || 'No URL provided',
+    sourceAccuracy: Math.ceil(sourceData.reliability / 20),
+    sourceFactChecking: sourceData.factChecking || 3,
+    sourceEditorialStandards: sourceData.editorialStandards || 3,
+    sourceTransparency: sourceData.transparency || 3,
+    sourceKnownFor: sourceData.knownFor || DEFAULT_KNOWN_FOR,
+
+    // Content analysis
+    keyTerms,
+    title: originalTitle,
+    contentSnippet: analysisText ? (analysisText.substring(0, 200) + '...') : 'No content available',
+
+    // Social media metrics
+    socialMetrics,
+
+    // Red flags
+    redFlags: sourceData.reliability < 40 ? LOW_CREDIBILITY_RED_FLAGS : EMPTY_LIST,
+
+    // Educational resources
+    educationalResources,
+
+    // Add more detailed content analysis information
+    contentAnalysis: {
+      wordCount: analysisWords.length,
+      readabilityLevel,
+      factualIndicators: getFactualIndicators(analysisText),
+      subjectivityLevel: getSubjectivityLevel(analysisText, languageScore)
     }
-    
-    // For highly credible sources, keep score high
-    if (sourceData.reliability >= 85) {
-      credibilityScore = Math.max(credibilityScore, 85);
+  };
+
+  // console.log("API response includes socialMetrics:", !!result.socialMetrics);
+  
+  return result;
+};
+
+// Main analysis endpoint
+router.post('/analyze', async (req, res) => {
+  try {
+    res.json(await analyzeArticle(req.body));
+  } catch (error) {
+    // console.error('Analysis error:', error);
+    res.status(500).json({ error: 'Error analyzing content' });
+  }
+});
+
+// Helper function to check that an optional article field is absent or a string
+const isOptionalString = (value) => value === undefined || value === null || typeof value === 'string';
+
+// Batch analysis endpoint - runs the same analysis as /analyze for each article in one request
+router.post('/analyze-batch', async (req, res) => {
+  try {
+    const { items } = req.body;
+
+    if (!Array.isArray(items) || items.length === 0 || items.length > MAX_BATCH_ITEMS) {
+      return res.status(400).json({ error: `Please provide an items array of 1 to ${MAX_BATCH_ITEMS} articles` });
     }
-    
-    // For less credible sources, ALWAYS keep score lower than 40
-    if (sourceData.reliability < 50) {
-      credibilityScore = Math.min(40, credibilityScore);
+
+    const invalidIndex = items.findIndex(item =>
+      !item || typeof item !== 'object' ||
+      !isOptionalString(item.url) || !isOptionalString(item.title) || !isOptionalString(item.content));
+    if (invalidIndex !== -1) {
+      return res.status(400).json({ error: `Item ${invalidIndex} must be an object whose url, title and content are strings` });
     }
-    
-    // Round the credibility score for consistency
-    credibilityScore = Math.round(credibilityScore);
-    let positivesrc = (sentiment.sentiment == 'positive') ? sentiment.probability : 0;
-    let negativesrc = (sentiment.sentiment == 'negative') ? sentiment.probability : 0;
-
-    // Generate comprehensive analysis results
-    const result = {
-      // Credibility metrics
-      
-     
-      fakeProbability : 100-FakeNews.confidence*90, 
-    isLikelyFake : (FakeNews.prediction == 'Fake' && FakeNews.confidence > 50) ? true : false,
-    confidence :FakeNews.confidence*85,
-    contentType : 'NEWS',
-    keyFeatures : [],
-    readabilityMetrics : getReadabilityLevel(analysisText),
-    patternAnalysis : {},
-    message : FakeNews.title,
-      sourceReliability: sourceData.reliability,
-      credibilityScore: credibilityScore,
-      languageScore: languageScore,
-
-       sentiment: {
-        positive: positivesrc,
-        negative: negativesrc,
-        neutral: sentiment.probability,
-        tone: sentiment.sentiment
-    },
-      contentScore: Math.min(sourceData.reliability + 10, 100),
-      factScore: Math.min(sourceData.reliability + (sourceData.factChecking * 5), 100),
-      // Verification status
-      verificationStatus: analyzer.getVerificationStatus(credibilityScore),
-
-      // Bias and sentiment
-      bias: sourceData.bias,
-      biasScore: biasScore,
-      biasLevel: analyzer.getBiasLevel(biasScore),
-      sentiment,
-
-      // Source information
-      source: sourceDomain || 'Unknown Source',
-      sourceUrl: url || 'No URL provided',
-      sourceAccuracy: Math.ceil(sourceData.reliability / 20),
-      sourceFactChecking: sourceData.factChecking || 3,
-      sourceEditorialStandards: sourceData.editorialStandards || 3,
-      sourceTransparency: sourceData.transparency || 3,
-      sourceKnownFor: sourceData.knownFor || ['General News Coverage'],
-
-      // Content analysis
-      keyTerms,
-      title: originalTitle,
-      contentSnippet: analysisText ? (analysisText.substring(0, 200) + '...') : 'No content available',
-
-      // Social media metrics
-      socialMetrics,
-
-      // Red flags
-      redFlags: sourceData.reliability < 40 ? ['Source has low credibility rating'] : [],
-
-      // Educational resources
-      educationalResources: {
-        quickTips: [
-          'Check the source\'s credibility',
-          'Look for unusual URLs or site names',
-          'Check the article\'s date and author',
-          'Watch for emotional language',
-          'Verify with fact-checking sites'
-        ],
-        guides: [
-          {
-            title: 'Source Evaluation',
-            tips: [
-              {
-                title: 'Check the Domain',
-                description: 'Verify if the website is legitimate and well-known'
-              },
-              {
-                title: 'Author Credentials',
-                description: 'Research the author\'s background and expertise'
-              }
-            ]
-          },
-          {
-            title: 'Content Analysis',
-            tips: [
-              {
-                title: 'Cross-Reference',
-                description: 'Verify the information with other reliable sources'
-              },
-              {
-                title: 'Check Dates',
-                description: 'Ensure the content is current and relevant'
-              }
-            ]
-          }
-        ],
-        recommendedResources: [
-          {
-            title: 'Fact-Checking Websites',
-            description: 'Popular fact-checking resources',
-            url: 'https://www.snopes.com'
-          },
-          {
-            title: 'Media Bias Chart',
-            description: 'Understanding news source biases',
-            url: 'https://www.adfontesmedia.com'
-          }
-        ]
-      },
-
-      // Add more detailed content analysis information
-      contentAnalysis: {
-        wordCount: analysisText ? analyzer.tokenizer.tokenize(analysisText).length : 0,
-        readabilityLevel: getReadabilityLevel(analysisText),
-        factualIndicators: getFactualIndicators(analysisText),
-        subjectivityLevel: getSubjectivityLevel(analysisText, languageScore)
+
+    // Repeated articles (e.g. the same article submitted twice) share one analysis; the maps are
+    // keyed by url, then title, then content so the article body is never copied into a combined key
+    const analyses = new Map();
+    const analyzeOnce = (item) => {
+      let byTitle = analyses.get(item.url);
+      if (!byTitle) {
+        byTitle = new Map();
+        analyses.set(item.url, byTitle);
+      }
+      let byContent = byTitle.get(item.title);
+      if (!byContent) {
+        byContent = new Map();
+        byTitle.set(item.title, byContent);
+      }
+      let analysis = byContent.get(item.content);
+      if (!analysis) {
+        // A failed article is reported in its own slot instead of failing the whole batch
+        analysis = analyzeArticle(item).catch(error => {
+          console.error('Batch item analysis error:', error.message);
+          return { error: 'Error analyzing content' };
+        });
+        byContent.set(item.content, analysis);
       }
+      return analysis;
     };
 
-    // console.log("API response includes socialMetrics:", !!result.socialMetrics);
-    
-    res.json(result);
+    const results = await Promise.all(items.map(analyzeOnce));
+
+    res.json({ results });
   } catch (error) {
-    // console.error('Analysis error:', error);
+    console.error('Batch analysis error:', error);
     res.status(500).json({ error: 'Error analyzing content' });
   }
 });
 
+
+// Helper function to check for the whitespace characters matched by \s
+const isWhitespaceCode = (code) =>
+  (code >= 9 && code <= 13) || code === 32 || code === 160 || code === 5760 ||
+  (code >= 8192 && code <= 8202) || code === 8232 || code === 8233 || code === 8239 ||
+  code === 8287 || code === 12288 || code === 65279;
+
 // Helper function to estimate text readability
 const getReadabilityLevel = (text) => {
   if (!text) return 'Unknown';
   
-  const words = text.split(/\s+/).filter(Boolean);
-  const sentences = text.split(/[.!?]+/).filter(Boolean);
+  // Count words, long words and sentences in one pass instead of splitting the text into arrays
+  let wordCount = 0;
+  let longWords = 0;
+  let sentenceCount = 0;
+  let wordLength = 0;
+  let inSentence = false;
+  
+  for (let i = 0; i <= text.length; i++) {
+    const code = i < text.length ? text.charCodeAt(i) : 32;
+    
+    if (isWhitespaceCode(code)) {
+      if (wordLength > 0) {
+        wordCount++;
+        if (wordLength > 6) longWords++;
+      }
+      wordLength = 0;
+    } else {
+      wordLength++;
+    }
+    
+    // Sentences are the non-empty runs between '.', '!' and '?'
+    if (code === 46 || code === 33 || code === 63) {
+      inSentence = false;
+    } else if (!inSentence && i < text.length) {
+      inSentence = true;
+      sentenceCount++;
+    }
+  }
   
-  if (words.length === 0 || sentences.length === 0) return 'Unknown';
+  if (wordCount === 0 || sentenceCount === 0) return 'Unknown';
   
-  const avgWordsPerSentence = words.length / sentences.length;
-  const longWords = words.filter(word => word.length > 6).length;
-  const percentLongWords = (longWords / words.length) * 100;
+  const avgWordsPerSentence = wordCount / sentenceCount;
+  const percentLongWords = (longWords / wordCount) * 100;
   
   // Simple readability estimate
   if (avgWordsPerSentence > 25 && percentLongWords > 25) {
@@ -267,25 +336,25 @@ const getFactualIndicators = (text) => {
   const indicators = [];
   
   // Check for statistics and numbers
-  const numberMatches = text.match(/\d+(\.\d+)?(\s*%)?/g) || [];
+  const numberMatches = text.match(NUMBER_REGEX) || [];
   if (numberMatches.length > 3) {
     indicators.push('Contains specific data and statistics');
   }
   
   // Check for quotes
-  const quoteMatches = text.match(/["'""].*?["'""]/g) || [];
+  const quoteMatches = text.match(QUOTE_REGEX) || [];
   if (quoteMatches.length > 1) {
     indicators.push('Contains direct quotes from sources');
   }
   
   // Check for specific dates
-  const dateMatches = text.match(/\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?\b/gi);
+  const dateMatches = text.match(MONTH_DATE_REGEX);
   if (dateMatches && dateMatches.length > 0) {
     indicators.push('Contains specific dates');
   }
   
   // Check for attributions
-  const attributionMatches = text.match(/according to|said|reported|stated|according|source/gi);
+  const attributionMatches = text.match(ATTRIBUTION_REGEX);
   if (attributionMatches && attributionMatches.length > 2) {
     indicators.push('Contains source attributions');
   }
@@ -12,36 +12,141 @@ const {
     stopWords
   } = require('./../data');
 const natural = require('natural');
+const { buildCategoryMatcher, findCategories } = require('./phraseMatcher');
 
 // Initialize NLP tools
 const tokenizer = new natural.WordTokenizer();
 const TfIdf = natural.TfIdf;
 
+// With a single document every term gets the same TF-IDF idf, so key terms rank by frequency alone
+const SINGLE_DOCUMENT_IDF = 1 + Math.log(1 / 2);
+// natural's TfIdf stop words plus our own, merged into one set for constant-time lookups
+const keyTermStopWords = new Set([...natural.stopwords, ...stopWords]);
+
+// Tokens only contain word characters, so lexicon phrases with spaces or punctuation can never
+// appear inside a single token; word-level checks only need to scan the single-word terms
+const TOKEN_TERM_REGEX = /^[A-Za-zА-Яа-я0-9_]+$/;
+const toTokenTerms = (terms) => terms.filter(term => TOKEN_TERM_REGEX.test(term));
+const positiveTokenTerms = toTokenTerms(positiveWords);
+const negativeTokenTerms = toTokenTerms(negativeWords);
+const sensationalTokenTerms = toTokenTerms(sensationalWords);
+const scientificTokenTerms = toTokenTerms(scientificWords);
+const languageMatcher = buildCategoryMatcher({
+  sensational: sensationalTokenTerms,
+  scientific: scientificTokenTerms
+});
+const biasMatcher = buildCategoryMatcher({
+  left: toTokenTerms(leftBiasWords),
+  right: toTokenTerms(rightBiasWords)
+});
+
+// Every substring of every bias word, so "bias word contains this word" is a single set lookup
+const toSubstringSet = (terms) => {
+  const substrings = new Set();
+  terms.forEach(term => {
+    for (let start = 0; start < term.length; start++) {
+      for (let end = start + 1; end <= term.length; end++) {
+        substrings.add(term.slice(start, end));
+      }
+    }
+  });
+  return substrings;
+};
+const leftBiasSubstrings = toSubstringSet(leftBiasWords);
+const rightBiasSubstrings = toSubstringSet(rightBiasWords);
+
+// Sentiment modifiers, built once rather than on every word checked
+const negationWords = new Set(['not', 'no', 'never', "don't", "doesn't", "didn't", "isn't", "aren't", "wasn't", "weren't"]);
+const intensifierWords = new Set(['very', 'extremely', 'highly', 'absolutely', 'completely', 'totally', 'utterly', 'really', 'especially']);
+
+// Helper function to check for the characters the WordTokenizer keeps: [A-Za-zА-Яа-я0-9_]
+const isTokenCharCode = (code) =>
+  (code >= 48 && code <= 57) || (code >= 65 && code <= 90) || code === 95 ||
+  (code >= 97 && code <= 122) || (code >= 1040 && code <= 1103);
+
+// Helper function to count the tokens the WordTokenizer would produce without building them
+const countTokens = (text) => {
+  let count = 0;
+  let inToken = false;
+  for (let i = 0; i < text.length; i++) {
+    if (isTokenCharCode(text.charCodeAt(i))) {
+      if (!inToken) count++;
+      inToken = true;
+    } else {
+      inToken = false;
+    }
+  }
+  return count;
+};
+
+// Helper function to count the pieces text.split(/[.!?]+/) would produce: one more than
+// the number of runs of sentence terminators, found with a single character scan
+const countSentences = (text) => {
+  let count = 1;
+  let inTerminator = false;
+  for (let i = 0; i < text.length; i++) {
+    const code = text.charCodeAt(i);
+    if (code === 46 || code === 33 || code === 63) {
+      if (!inTerminator) count++;
+      inTerminator = true;
+    } else {
+      inTerminator = false;
+    }
+  }
+  return count;
+};
+
+// Helper function to check the five words either side of index for quote marks
+// without building the joined context string for every matched word
+const hasNearbyQuote = (words, index) => {
+  const end = Math.min(words.length, index + 6);
+  for (let i = Math.max(0, index - 5); i < end; i++) {
+    if (words[i].includes('"') || words[i].includes("'")) return true;
+  }
+  return false;
+};
+
+// Helper function to check the three words before index for a negation
+const hasNegationBefore = (words, index) => {
+  for (let i = Math.max(0, index - 3); i < index; i++) {
+    if (negationWords.has(words[i])) return true;
+  }
+  return false;
+};
+
 // Improved sentiment analysis function with boosted positive and negative scores
-const analyzeSentiment = (text) => {
-  // Tokenize and count sentiment words
-  const words = tokenizer.tokenize(text.toLowerCase());
+const analyzeSentiment = (text, tokens) => {
+  // Tokenize and count sentiment words (callers that already tokenized the text can pass the tokens)
+  const words = tokens || tokenizer.tokenize(text.toLowerCase());
   // console.log("these are words "+words);
 
 
   let positive = 0;
   let negative = 0;
   
+  // Match each distinct word against the lexicons only once; most words match neither
+  const polarityCache = new Map();
+  const getPolarity = (word) => {
+    let polarity = polarityCache.get(word);
+    if (polarity === undefined) {
+      polarity = {
+        // Check if word matches or contains a positive or negative lexicon word
+        positive: positiveTokenTerms.some(pos => word === pos || word.includes(pos)),
+        negative: negativeTokenTerms.some(neg => word === neg || word.includes(neg))
+      };
+      polarityCache.set(word, polarity);
+    }
+    return polarity;
+  };
+  
   // Use a more sophisticated word matching approach
-  words.forEach(word => {
+  words.forEach((word, index) => {
+    const polarity = getPolarity(word);
     
     // For positive words, check for negation in preceding words
-    const isPositiveWord = positiveWords.some(pos => {
-      // Check if word matches or contains the positive word
-      return word === pos || word.includes(pos);
-    });
-    
-    if (isPositiveWord) {
-      console.log("this is a positive word " + word);
+    if (polarity.positive) {
       // Check for negations in nearby words that could flip sentiment
-      const wordIndex = words.indexOf(word);
-      const previousWords = words.slice(Math.max(0, wordIndex - 3), wordIndex);
-      const hasNegation = previousWords.some(w => ['not', 'no', 'never', "don't", "doesn't", "didn't", "isn't", "aren't", "wasn't", "weren't"].includes(w));
+      const hasNegation = hasNegationBefore(words, index);
       
       // Apply boosted scoring - positives get greater weight
       if (hasNegation) {
@@ -54,15 +159,8 @@ const analyzeSentiment = (text) => {
     }
     
     // For negative words, also check for negation which could make them positive
-    const isNegativeWord = negativeWords.some(neg => {
-      return word === neg || word.includes(neg);
-    });
-    
-    if (isNegativeWord) {
-      console.log("this is a negative word " + word);
-      const wordIndex = words.indexOf(word);
-      const previousWords = words.slice(Math.max(0, wordIndex - 3), wordIndex);
-      const hasNegation = previousWords.some(w => ['not', 'no', 'never', "don't", "doesn't", "didn't", "isn't", "aren't", "wasn't", "weren't"].includes(w));
+    if (polarity.negative) {
+      const hasNegation = hasNegationBefore(words, index);
       
       // Apply boosted scoring - negatives get greater weight
       if (hasNegation) {
@@ -77,18 +175,17 @@ const analyzeSentiment = (text) => {
   });
   
   // Check for intensifiers to boost scores further
-  const intensifiers = ['very', 'extremely', 'highly', 'absolutely', 'completely', 'totally', 'utterly', 'really', 'especially'];
   words.forEach((word, index) => {
-    if (intensifiers.includes(word)) {
+    if (intensifierWords.has(word)) {
       // Look at the word following the intensifier
       if (index + 1 < words.length) {
-        const nextWord = words[index + 1];
+        const nextPolarity = getPolarity(words[index + 1]);
         // Check if next word is positive
-        if (positiveWords.some(pos => nextWord === pos || nextWord.includes(pos))) {
+        if (nextPolarity.positive) {
           positive += 1.0; // Extra boost for intensified positive words
         }
         // Check if next word is negative
-        if (negativeWords.some(neg => nextWord === neg || nextWord.includes(neg))) {
+        if (nextPolarity.negative) {
           negative += 1.0; // Extra boost for intensified negative words
         }
       }
@@ -123,10 +220,10 @@ const analyzeSentiment = (text) => {
 };
 
 // Improved language score calculation that better detects factual reporting
-const calculateLanguageScore = (text) => {
+const calculateLanguageScore = (text, tokens) => {
   if (!text || text.length < 10) return 50; // Default for very short text
   
-  const words = tokenizer.tokenize(text.toLowerCase());
+  const words = tokens || tokenizer.tokenize(text.toLowerCase());
   
   // Count occurrences of each language type
   let sensationalCount = 0;
@@ -134,11 +231,13 @@ const calculateLanguageScore = (text) => {
   
   // More sophisticated sensational word detection with context awareness
   words.forEach((word, index) => {
+    // One automaton pass over the word finds both sensational and scientific terms
+    const categories = findCategories(languageMatcher, word);
+    
     // Check for sensational words
-    if (sensationalWords.some(term => word.includes(term))) {
+    if (categories.has('sensational')) {
       // Check if word is part of a legitimate quote (reduces false positives)
-      const surroundingText = words.slice(Math.max(0, index - 5), Math.min(words.length, index + 6)).join(' ');
-      if (!surroundingText.includes('"') && !surroundingText.includes("'")) {
+      if (!hasNearbyQuote(words, index)) {
         sensationalCount++;
       } else {
         // Lower weight for sensational words in quotes
@@ -147,14 +246,13 @@ const calculateLanguageScore = (text) => {
     }
     
     // Check for scientific words
-    if (scientificWords.some(term => word.includes(term))) {
+    if (categories.has('scientific')) {
       scientificCount++;
     }
   });
   
   // Consider sentence structure for factual reporting (avoid penalizing longer articles)
-  const sentences = text.split(/[.!?]+/);
-  const averageWordsPerSentence = words.length / sentences.length;
+  const averageWordsPerSentence = words.length / countSentences(text);
   
   // The ideal average words per sentence for factual reporting is between 15-25
   // Higher or lower may impact the language score
@@ -181,9 +279,9 @@ const calculateLanguageScore = (text) => {
 };
 
 // Helper function to calculate bias - improved to avoid false positives
-const calculateBias = (text) => {
-  // Use the same tokenizer for consistency
-  const words = tokenizer.tokenize(text.toLowerCase());
+const calculateBias = (text, tokens) => {
+  // Use the same tokenizer for consistency, or the caller's tokens of the same text
+  const words = tokens || tokenizer.tokenize(text.toLowerCase());
   
   // Count occurrences of bias words
   let leftCount = 0;
@@ -192,9 +290,11 @@ const calculateBias = (text) => {
   const biasWordContext = [];
   
   words.forEach((word, index) => {
+    // Find the bias words this word contains in one scan
+    const containedBias = findCategories(biasMatcher, word);
+    
     // Check if any left-bias word contains this word or vice versa
-    if (leftBiasWords.some(biasWord => 
-      word.includes(biasWord) || biasWord.includes(word))) {
+    if (containedBias.has('left') || leftBiasSubstrings.has(word)) {
       // Check if this is quoted material - adjust weight if so
       const surroundingText = words.slice(Math.max(0, index - 5), Math.min(words.length, index + 6)).join(' ');
       if (surroundingText.includes('"') || surroundingText.includes("'")) {
@@ -211,8 +311,7 @@ const calculateBias = (text) => {
     }
     
     // Check if any right-bias word contains this word or vice versa
-    if (rightBiasWords.some(biasWord => 
-      word.includes(biasWord) || biasWord.includes(word))) {
+    if (containedBias.has('right') || rightBiasSubstrings.has(word)) {
       // Check if this is quoted material - adjust weight if so
       const surroundingText = words.slice(Math.max(0, index - 5), Math.min(words.length, index + 6)).join(' ');
       if (surroundingText.includes('"') || surroundingText.includes("'")) {
@@ -252,25 +351,47 @@ const getBiasLevel = (biasScore) => {
   return 'center';
 };
 
+// Helper function to pick the most frequent terms without sorting every distinct term;
+// ties keep their first-seen order, matching a stable descending sort
+const selectTopTerms = (counts, limit) => {
+  const terms = Object.keys(counts);
+  // Short texts often have no more distinct terms than the limit; a plain sort of those is cheapest
+  if (terms.length <= limit) {
+    return terms.sort((a, b) => counts[b] - counts[a]);
+  }
+  
+  const top = [];
+  terms.forEach(term => {
+    const count = counts[term];
+    if (top.length === limit && counts[top[limit - 1]] >= count) return;
+    
+    let position = top.length;
+    while (position > 0 && counts[top[position - 1]] < count) position--;
+    top.splice(position, 0, term);
+    if (top.length > limit) top.pop();
+  });
+  return top;
+};
+
 // Helper function to extract key terms with improved relevance
-const extractKeyTerms = (text) => {
+const extractKeyTerms = (text, tokens) => {
   if (!text || text.length < 10) return [];
   
-  const tfidf = new natural.TfIdf(); // Create a new instance for each text analysis
-  tfidf.addDocument(text);
-  
-  // Add stop words to improve term extraction
-  const terms = [];
-  tfidf.listTerms(0).forEach(item => {
-    // Filter out stop words and short terms
-    if (!stopWords.includes(item.term) && item.term.length > 2) {
-      terms.push({
-        text: item.term,
-        value: Math.round(item.tfidf * 100)
-      });
+  // Count term frequencies directly instead of building a TfIdf corpus for each text,
+  // dropping stop words and short terms up front so they are never counted or sorted
+  const counts = Object.create(null);
+  const words = tokens || tokenizer.tokenize(text.toLowerCase());
+  words.forEach(term => {
+    if (term.length > 2 && !keyTermStopWords.has(term)) {
+      counts[term] = (counts[term] || 0) + 1;
     }
   });
-  return terms.slice(0, 20); // Return top 20 terms
+  
+  // Return top 20 terms
+  return selectTopTerms(counts, 20).map(term => ({
+    text: term,
+    value: Math.round(counts[term] * SINGLE_DOCUMENT_IDF * 100)
+  }));
 };
 
 // Helper function to get verification status
@@ -283,6 +404,7 @@ const getVerificationStatus = (credibilityScore) => {
 
 module.exports = {
   tokenizer,
+  countTokens,
   sensationalWords,
   scientificWords,
   analyzeSentiment,
@@ -0,0 +1,16 @@
+/**
+ * HTTP client service
+ * One shared axios instance for the local ML services
+ */
+const axios = require('axios');
+const http = require('http');
+
+// Created once per process; the keep-alive agent reuses warm connections to the ML services.
+// The 5s idle timeout matches Node's default global agent, so idle sockets are still closed.
+// Article scraping stays on plain axios so no sockets are held open to user-supplied hosts
+const ML_SOCKET_IDLE_TIMEOUT = 5000;
+const httpClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true, timeout: ML_SOCKET_IDLE_TIMEOUT })
+});
+
+module.exports = httpClient;
@@ -4,14 +4,55 @@
  */
 const analyzer = require('./analyzer');
 const sourceService = require('./sourceData');
+const { buildPhraseMatcher, buildCategoryMatcher, findPhrases, findCategories } = require('./phraseMatcher');
 
 const {fakePhrases}=require('./../data');
-const axios = require('axios'); // Add axios for making HTTP requests to the ML model
+const httpClient = require('./httpClient'); // Shared client for making HTTP requests to the ML model
 
 // Additional imports for improved text analysis
 const natural = require('natural');
 const TfIdf = natural.TfIdf;
 
+// Regular expressions used on every analysis, compiled once at module load
+const PARAGRAPH_SPLIT_REGEX = /\n\s*\n|\r\n\s*\r\n/;
+const SENTENCE_SPLIT_REGEX = /[.!?]+/;
+const QUOTE_REGEX = /["'""].*?["'""]/g;
+const NUMBER_REGEX = /\d+(\.\d+)?(\s*%)?/g;
+const CAPITALIZED_RUN_REGEX = /[A-Z]{2,}/g;
+// Mainstream news domain checks as single patterns instead of keyword and suffix loops
+const NEWS_DOMAIN_KEYWORD_REGEX = /news|post|herald|tribune|times|daily|journal|gazette/;
+const NEWS_TLD_REGEX = /\.(?:com|org|net)$/;
+// Attribution phrases as one alternation; none overlaps another, so one scan counts the same matches
+const ATTRIBUTION_REGEX = /according to|said|reported|stated|announced|confirmed|explained|noted|added|commented|revealed/gi;
+const DATE_PATTERNS = [
+    /\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/g,  // MM/DD/YYYY
+    /\b\d{1,2}-\d{1,2}-\d{2,4}\b/g,    // MM-DD-YYYY
+    /\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?\b/gi, // Month DD, YYYY
+    /\btoday\b|\byesterday\b|\blast week\b|\blast month\b|\blast year\b|\brecently\b|\bearlier\b|\blast\s+(?:week|month|year)\b/gi // Temporal references
+];
+// Attribution phrases and date patterns combined so the content is scanned once;
+// group 1 captures an attribution, group 2 a date or temporal reference
+const STRUCTURAL_SIGNAL_REGEX = new RegExp(
+    `(${ATTRIBUTION_REGEX.source})|(${DATE_PATTERNS.map(pattern => pattern.source).join('|')})`,
+    'gi'
+);
+// Attribution and date bonuses are capped, so counting stops at five of each
+const STRUCTURAL_SIGNAL_LIMIT = 5;
+
+// Lowercased single terms of each lexicon phrase, split once instead of for every word analyzed
+const toLexiconTerms = (phrases) => [...new Set(phrases.flatMap(phrase => phrase.toLowerCase().split(' ')))];
+const sensationalTerms = toLexiconTerms(analyzer.sensationalWords);
+const scientificTerms = toLexiconTerms(analyzer.scientificWords);
+const lexiconMatcher = buildCategoryMatcher({
+    sensational: sensationalTerms,
+    scientific: scientificTerms
+});
+
+// Automaton over all fake news phrases so the text is scanned once instead of once per phrase
+const fakePhraseMatcher = buildPhraseMatcher(fakePhrases);
+// Number of distinct fake news phrases at which the phrase score reaches its maximum
+const FAKE_PHRASE_SATURATION = 3;
+
 // Analyze news content
 const analyzeContent = async (title, content, sourceUrl) => {
     // Combine title and content for analysis
@@ -35,46 +76,35 @@ const analyzeContent = async (title, content, sourceUrl) => {
         };
     }
     
-    // Calculate sensational language score
-    const sensationalWordsFound = words.filter(word => 
-        analyzer.sensationalWords.some(sensational => {
-            const sensTerms = sensational.toLowerCase().split(' ');
-            return sensTerms.some(term => word.includes(term));
-        })
-    );
+    // Count sensational and scientific words in one scan per word; only the counts are needed
+    let sensationalWordCount = 0;
+    let scientificWordCount = 0;
+    words.forEach(word => {
+        const categories = findCategories(lexiconMatcher, word);
+        if (categories.has('sensational')) sensationalWordCount++;
+        if (categories.has('scientific')) scientificWordCount++;
+    });
     
-    const sensationalScore = sensationalWordsFound.length / words.length;
-    // console.log(`Sensational words found: ${sensationalWordsFound.length}, words: ${sensationalWordsFound.join(', ')}`);
+    // Calculate sensational language score
+    const sensationalScore = sensationalWordCount / words.length;
+    // console.log(`Sensational words found: ${sensationalWordCount}`);
 
     // Calculate scientific language score
-    const scientificWordsFound = words.filter(word => 
-        analyzer.scientificWords.some(scientific => {
-            const sciTerms = scientific.toLowerCase().split(' ');
-            return sciTerms.some(term => word.includes(term));
-        })
-    );
-    
-    const scientificScore = scientificWordsFound.length / words.length;
-    // console.log(`Scientific words found: ${scientificWordsFound.length}, words: ${scientificWordsFound.join(', ')}`);
+    const scientificScore = scientificWordCount / words.length;
+    // console.log(`Scientific words found: ${scientificWordCount}`);
 
     // Calculate language score (0-100) based on sensational vs scientific language
     const languageScore = Math.max(0, Math.min(100, 50 - (sensationalScore * 200) + (scientificScore * 200)));
     
-    // Check for fake news phrases
-    let fakePhrasesCount = 0;
-    let fakePhrasesList = [];
-    fakePhrases.forEach(phrase => {
-        if (fullText.includes(phrase)) {
-            fakePhrasesCount++;
-            fakePhrasesList.push(phrase);
-        }
-    });
+    // Check for fake news phrases; the score saturates at three, so stop scanning once three are found
+    const fakePhrasesList = findPhrases(fakePhraseMatcher, fullText, FAKE_PHRASE_SATURATION);
+    const fakePhrasesCount = fakePhrasesList.length;
     if (fakePhrasesCount > 0) {
         // console.log(`Fake phrases found: ${fakePhrasesList.join(', ')}`);
     }
     
     // Calculate fake phrases score (0-1)
-    const fakePhraseScore = Math.min(1, fakePhrasesCount / 3);
+    const fakePhraseScore = Math.min(1, fakePhrasesCount / FAKE_PHRASE_SATURATION);
     
     // NEW: Analyze structural elements that indicate quality journalism
     const structuralScore = analyzeStructuralElements(content);
@@ -109,7 +139,7 @@ const analyzeContent = async (title, content, sourceUrl) => {
     
         // console.error('Error using ML for sentiment analysis, falling back to rule-based:', error);
         // Fall back to the traditional sentiment analysis
-        sentiment = analyzer.analyzeSentiment(fullText);
+        sentiment = analyzer.analyzeSentiment(fullText, words);
     
 
     // NEW: Use ML-based bias detection when possible
@@ -117,7 +147,7 @@ const analyzeContent = async (title, content, sourceUrl) => {
     
         // console.error('Error using ML for bias detection, falling back to rule-based:', error);
         // Fall back to the traditional bias calculation
-        const biasScore = analyzer.calculateBias(fullText);
+        const biasScore = analyzer.calculateBias(fullText, words);
         biasResult = {
             biasScore,
             biasLevel: analyzer.getBiasLevel(biasScore)
@@ -165,48 +195,33 @@ const analyzeStructuralElements = (content) => {
     let score = 50; // Start with neutral score
     
     // Check for paragraph structure (legitimate news typically has proper paragraphs)
-    const paragraphs = content.split(/\n\s*\n|\r\n\s*\r\n/);
+    const paragraphs = content.split(PARAGRAPH_SPLIT_REGEX);
     if (paragraphs.length >= 3) {
         score += 5;
     }
     
     // Check for quotes (legitimate reporting often includes quotes)
-    const quoteMatches = content.match(/["'""].*?["'""]/g) || [];
+    const quoteMatches = content.match(QUOTE_REGEX) || [];
     score += Math.min(15, quoteMatches.length * 3);
     
     // Check for numbers and statistics (factual reporting often includes specific figures)
-    const numberMatches = content.match(/\d+(\.\d+)?(\s*%)?/g) || [];
+    const numberMatches = content.match(NUMBER_REGEX) || [];
     score += Math.min(10, numberMatches.length * 2);
     
-    // Check for attribution phrases ("according to", "said", etc.)
-    const attributionPhrases = [
-        "according to", "said", "reported", "stated", "announced", "confirmed",
-        "explained", "noted", "added", "commented", "revealed"
-    ];
-    
+    // Check for attribution phrases ("according to", "said", etc.) and for dates and
+    // temporal references (suggests timely reporting) in a single pass
     let attributionCount = 0;
-    attributionPhrases.forEach(phrase => {
-        const regex = new RegExp(phrase, 'gi');
-        const matches = content.match(regex) || [];
-        attributionCount += matches.length;
-    });
-    
-    score += Math.min(15, attributionCount * 3);
-    
-    // Check for dates and temporal references (suggests timely reporting)
-    const datePatterns = [
-        /\b\d{1,2}\/\d{1,2}\/\d{2,4}\b/g,  // MM/DD/YYYY
-        /\b\d{1,2}-\d{1,2}-\d{2,4}\b/g,    // MM-DD-YYYY
-        /\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?\b/gi, // Month DD, YYYY
-        /\btoday\b|\byesterday\b|\blast week\b|\blast month\b|\blast year\b|\brecently\b|\bearlier\b|\blast\s+(?:week|month|year)\b/gi // Temporal references
-    ];
-    
     let dateCount = 0;
-    datePatterns.forEach(pattern => {
-        const matches = content.match(pattern) || [];
-        dateCount += matches.length;
-    });
+    for (const match of content.matchAll(STRUCTURAL_SIGNAL_REGEX)) {
+        if (match[1] !== undefined) {
+            attributionCount++;
+        } else {
+            dateCount++;
+        }
+        if (attributionCount >= STRUCTURAL_SIGNAL_LIMIT && dateCount >= STRUCTURAL_SIGNAL_LIMIT) break;
+    }
     
+    score += Math.min(15, attributionCount * 3);
     score += Math.min(10, dateCount * 2);
     
     return Math.min(100, score);
@@ -215,7 +230,7 @@ const analyzeStructuralElements = (content) => {
 // NEW: Analyze text coherence
 const analyzeTextCoherence = (words, fullText) => {
     // Check for sentence structure and readability
-    const sentences = fullText.split(/[.!?]+/);
+    const sentences = fullText.split(SENTENCE_SPLIT_REGEX);
     if (sentences.length < 2) return 50; // Default score for very short content
     
     // Calculate average sentence length (too short or too long sentences are suspicious)
@@ -231,7 +246,9 @@ const analyzeTextCoherence = (words, fullText) => {
     }
     
     // Calculate sentence variety (more variance suggests more natural writing)
-    const sentenceLengths = sentences.map(s => analyzer.tokenizer.tokenize(s).length);
+    // Word counts fit in a compact typed array instead of an array of boxed numbers; each sentence's
+    // tokens are counted in one character pass rather than tokenized into a throwaway array
+    const sentenceLengths = Uint32Array.from(sentences, s => analyzer.countTokens(s));
     const sentenceLengthVariance = calculateVariance(sentenceLengths);
     const sentenceVarietyScore = Math.min(100, Math.max(0, 
         50 + (sentenceLengthVariance * 10)
@@ -256,8 +273,13 @@ const analyzeTextCoherence = (words, fullText) => {
 const calculateVariance = (arr) => {
     if (arr.length < 2) return 0;
     const mean = arr.reduce((sum, val) => sum + val, 0) / arr.length;
-    const squareDiffs = arr.map(val => Math.pow(val - mean, 2));
-    return squareDiffs.reduce((sum, val) => sum + val, 0) / arr.length;
+    // Accumulate squared differences directly rather than materializing them in a second array
+    let squareDiffSum = 0;
+    for (let i = 0; i < arr.length; i++) {
+        const diff = arr[i] - mean;
+        squareDiffSum += diff * diff;
+    }
+    return squareDiffSum / arr.length;
 };
 
 // Calculate credibility score based on various factors
@@ -324,7 +346,7 @@ const calculateCredibilityScore = (
     }
 
     // Check for excessive capitalization
-    const capitalizedCount = (content.match(/[A-Z]{2,}/g) || []).length;
+    const capitalizedCount = (content.match(CAPITALIZED_RUN_REGEX) || []).length;
     if (capitalizedCount > 3) {
         credibilityScore -= Math.min(15, capitalizedCount * 2); // Reduced from 3x penalty
         redFlags.push('excessive capitalization');
@@ -361,11 +383,10 @@ const checkSourceCredibility = async (sourceUrl) => {
 // NEW: Helper function to identify mainstream news domains not in our database
 const isMainstreamNewsDomain = (domain) => {
     // Check if the domain contains common news-related terms
-    const newsDomainKeywords = ['news', 'post', 'herald', 'tribune', 'times', 'daily', 'journal', 'gazette'];
-    const isDomainLikelyNews = newsDomainKeywords.some(keyword => domain.includes(keyword));
+    const isDomainLikelyNews = NEWS_DOMAIN_KEYWORD_REGEX.test(domain);
     
     // Check if the domain ends with common news TLDs
-    const isNewsTLD = domain.endsWith('.com') || domain.endsWith('.org') || domain.endsWith('.net');
+    const isNewsTLD = NEWS_TLD_REGEX.test(domain);
     
     return isDomainLikelyNews && isNewsTLD;
 };
@@ -373,13 +394,11 @@ const isMainstreamNewsDomain = (domain) => {
 // Call ML model for fake/true classification and sentiment analysis
 const analyzeWithMLModel = async (url,title,content) => {
     try {
-        console.log('Calling ML model with:', { url }); // Log the input
-        const response = await axios.post('http://127.0.0.1:5000/analyze', {
+        const response = await httpClient.post('http://127.0.0.1:5000/analyze', {
             url,
             title,
             content
         });
-        console.log('ML model response:', response.data); // Log the ML model's output
         return response.data; // Return the ML model's output
     } catch (error) {
         console.error('Error calling ML model:', error.message);
@@ -388,13 +407,11 @@ const analyzeWithMLModel = async (url,title,content) => {
 };
 const fakeNews = async (url,title,content) => {
     try {
-        console.log('Calling ML model with:', { url }); // Log the input
-        const response = await axios.post('http://127.0.0.1:5001/detect_fake_news', {
+        const response = await httpClient.post('http://127.0.0.1:5001/detect_fake_news', {
             url,
             title,
             content
         });
-        console.log('ML model response:', response.data);
         return response.data; // Return the ML model's output
     } catch (error) {
         console.error('Error calling ML model:', error.message);
@@ -0,0 +1,117 @@
+/**
+ * Phrase matcher service
+ * Aho-Corasick automaton that finds every phrase from a fixed list in a single pass over the text
+ */
+
+// Build the automaton once for a list of literal phrases
+const buildPhraseMatcher = (phrases) => {
+  const transitions = [new Map()];
+  const failure = [0];
+  const outputs = [[]];
+
+  // Insert every phrase into the trie, remembering its position in the list
+  phrases.forEach((phrase, index) => {
+    let state = 0;
+    for (let i = 0; i < phrase.length; i++) {
+      const char = phrase[i];
+      let next = transitions[state].get(char);
+      if (next === undefined) {
+        next = transitions.length;
+        transitions.push(new Map());
+        failure.push(0);
+        outputs.push([]);
+        transitions[state].set(char, next);
+      }
+      state = next;
+    }
+    outputs[state].push(index);
+  });
+
+  // Compute failure links breadth-first so each state also reports the phrases of its longest suffix
+  const queue = [...transitions[0].values()];
+  for (let head = 0; head < queue.length; head++) {
+    const state = queue[head];
+    transitions[state].forEach((next, char) => {
+      let fallback = failure[state];
+      while (fallback !== 0 && !transitions[fallback].has(char)) {
+        fallback = failure[fallback];
+      }
+      const target = transitions[fallback].get(char);
+      failure[next] = target !== undefined && target !== next ? target : 0;
+      if (outputs[failure[next]].length > 0) {
+        outputs[next] = outputs[next].concat(outputs[failure[next]]);
+      }
+      queue.push(next);
+    });
+  }
+
+  return { phrases, transitions, failure, outputs };
+};
+
+// Build one automaton over several named term lists so a single scan reports every list that matched
+const buildCategoryMatcher = (categories) => {
+  const phrases = [];
+  const phraseCategories = [];
+  Object.entries(categories).forEach(([category, terms]) => {
+    terms.forEach(term => {
+      phrases.push(term);
+      phraseCategories.push(category);
+    });
+  });
+
+  return { ...buildPhraseMatcher(phrases), phraseCategories, categoryCount: Object.keys(categories).length };
+};
+
+// Walk the text once, calling onMatch with the list index of every phrase occurrence;
+// the scan stops early as soon as onMatch returns true
+const scanPhrases = (matcher, text, onMatch) => {
+  const { transitions, failure, outputs } = matcher;
+  let state = 0;
+
+  for (let i = 0; i < text.length; i++) {
+    const char = text[i];
+    while (state !== 0 && !transitions[state].has(char)) {
+      state = failure[state];
+    }
+    state = transitions[state].get(char) || 0;
+    const matches = outputs[state];
+    for (let j = 0; j < matches.length; j++) {
+      if (onMatch(matches[j])) return;
+    }
+  }
+};
+
+// Return the phrases contained in the text, in the same order as the phrase list.
+// With a limit, scanning stops once that many distinct phrases have been found
+const findPhrases = (matcher, text, limit = Infinity) => {
+  const found = new Uint8Array(matcher.phrases.length);
+  let foundCount = 0;
+  scanPhrases(matcher, text, index => {
+    if (found[index] === 0) {
+      found[index] = 1;
+      foundCount++;
+    }
+    return foundCount >= limit;
+  });
+
+  return matcher.phrases.filter((phrase, index) => found[index] === 1);
+};
+
+// Return the names of the categories that have at least one term contained in the text,
+// stopping as soon as every category has matched
+const findCategories = (matcher, text) => {
+  const found = new Set();
+  scanPhrases(matcher, text, index => {
+    found.add(matcher.phraseCategories[index]);
+    return found.size === matcher.categoryCount;
+  });
+
+  return found;
+};
+
+module.exports = {
+  buildPhraseMatcher,
+  buildCategoryMatcher,
+  findPhrases,
+  findCategories
+};
@@ -6,6 +6,80 @@
 // Expanded and more accurate source data
 const {sourceReputationData} =require('./../data')
 
+// Characters stripped from title words when building hashtags
+const NON_ALPHANUMERIC_REGEX = /[^a-zA-Z0-9]/g;
+
+// Suspicious top-level domains, checked with one anchored pattern
+const SUSPICIOUS_TLD_REGEX = /\.(?:xyz|info|click|top|buzz|gq|ml|ga|cf)$/;
+
+// Helper function to determine what a known source is known for
+const describeKnownSource = (data) => {
+  let knownFor = [];
+  if (data.reliability > 85) knownFor.push('High Factual Reporting');
+  if (data.bias > 15) knownFor.push('Right-Leaning Coverage');
+  if (data.bias < -15) knownFor.push('Left-Leaning Coverage');
+  if (Math.abs(data.bias) < 10) knownFor.push('Balanced Reporting');
+  if (data.factChecking >= 4) knownFor.push('Strong Fact-Checking');
+  if (data.transparency >= 4) knownFor.push('Editorial Transparency');
+  
+  return knownFor.length > 0 ? knownFor : ['General News Coverage'];
+};
+
+// Profiles are shared by every lookup, so freeze them (and their knownFor lists) against mutation
+const freezeProfile = (profile) => Object.freeze({ ...profile, knownFor: Object.freeze(profile.knownFor) });
+
+// Full profiles for every domain in our database, built once at load instead of on every lookup
+const knownSourceProfiles = new Map(
+  Object.entries(sourceReputationData).map(([domain, data]) => [
+    domain,
+    freezeProfile({ ...data, knownFor: describeKnownSource(data) })
+  ])
+);
+
+// Profiles for domains outside our database, shared by every lookup instead of rebuilt per call
+const fallbackSourceProfiles = Object.freeze({
+  missing: freezeProfile({
+    reliability: 50,
+    bias: 0,
+    factChecking: 3,
+    editorialStandards: 3,
+    transparency: 3,
+    knownFor: ['Unknown Source']
+  }),
+  academic: freezeProfile({
+    reliability: 85,
+    bias: -5,
+    factChecking: 4,
+    editorialStandards: 4,
+    transparency: 4,
+    knownFor: ['Academic Research', 'Educational Content']
+  }),
+  government: freezeProfile({
+    reliability: 80,
+    bias: 0,
+    factChecking: 4,
+    editorialStandards: 4,
+    transparency: 4,
+    knownFor: ['Government Information', 'Official Statements']
+  }),
+  suspicious: freezeProfile({
+    reliability: 30,
+    bias: 0,
+    factChecking: 1,
+    editorialStandards: 1,
+    transparency: 1,
+    knownFor: ['Questionable Content', 'Suspicious Domain']
+  }),
+  unknown: freezeProfile({
+    reliability: 50,
+    bias: 0,
+    factChecking: 3,
+    editorialStandards: 3,
+    transparency: 3,
+    knownFor: ['Unknown Source Type']
+  })
+});
+
 // Helper function to extract domain from URL
 const extractDomain = (url) => {
   try {
@@ -17,81 +91,30 @@ const extractDomain = (url) => {
 
 // Determine source credibility with more accurate data
 const getSourceCredibility = (domain) => {
-  if (!domain) return {
-    reliability: 50,
-    bias: 0,
-    factChecking: 3,
-    editorialStandards: 3,
-    transparency: 3,
-    knownFor: ['Unknown Source']
-  };
+  if (!domain) return fallbackSourceProfiles.missing;
   
   // Check in our expanded database
-  if (sourceReputationData[domain]) {
-    const data = sourceReputationData[domain];
-    
-    // Determine what the source is known for
-    let knownFor = [];
-    if (data.reliability > 85) knownFor.push('High Factual Reporting');
-    if (data.bias > 15) knownFor.push('Right-Leaning Coverage');
-    if (data.bias < -15) knownFor.push('Left-Leaning Coverage');
-    if (Math.abs(data.bias) < 10) knownFor.push('Balanced Reporting');
-    if (data.factChecking >= 4) knownFor.push('Strong Fact-Checking');
-    if (data.transparency >= 4) knownFor.push('Editorial Transparency');
-    
-    return {
-      ...data,
-      knownFor: knownFor.length > 0 ? knownFor : ['General News Coverage']
-    };
+  const knownProfile = knownSourceProfiles.get(domain);
+  if (knownProfile) {
+    return knownProfile;
   }
   
   // Handle academic and government domains
   if (domain.endsWith('.edu')) {
-    return {
-      reliability: 85,
-      bias: -5,
-      factChecking: 4,
-      editorialStandards: 4,
-      transparency: 4,
-      knownFor: ['Academic Research', 'Educational Content']
-    };
+    return fallbackSourceProfiles.academic;
   }
   
   if (domain.endsWith('.gov')) {
-    return {
-      reliability: 80,
-      bias: 0,
-      factChecking: 4,
-      editorialStandards: 4,
-      transparency: 4,
-      knownFor: ['Government Information', 'Official Statements']
-    };
+    return fallbackSourceProfiles.government;
   }
   
   // Handle suspicious TLDs
-  const suspiciousTLDs = ['.xyz', '.info', '.click', '.top', '.buzz', '.gq', '.ml', '.ga', '.cf'];
-  for (const tld of suspiciousTLDs) {
-    if (domain.endsWith(tld)) {
-      return {
-        reliability: 30,
-        bias: 0,
-        factChecking: 1,
-        editorialStandards: 1,
-        transparency: 1,
-        knownFor: ['Questionable Content', 'Suspicious Domain']
-      };
-    }
+  if (SUSPICIOUS_TLD_REGEX.test(domain)) {
+    return fallbackSourceProfiles.suspicious;
   }
 
   // Default for unknown sources
-  return {
-    reliability: 50,
-    bias: 0,
-    factChecking: 3,
-    editorialStandards: 3,
-    transparency: 3,
-    knownFor: ['Unknown Source Type']
-  };
+  return fallbackSourceProfiles.unknown;
 };
 
 // Helper function to calculate discussion polarity based on bias
@@ -116,8 +139,6 @@ const generateSocialMetrics = (sourceData, title) => {
   const reliability = sourceData.reliability || 50;
   const bias = Math.abs(sourceData.bias || 0);
   
-  console.log("Generating social metrics for:", { reliability, bias, title });
-  
   // More reliable sources tend to have higher engagement
   // Biased sources tend to have more Twitter activity and polarized sentiment
   const baseEngagement = reliability * 100;
@@ -130,7 +151,7 @@ const generateSocialMetrics = (sourceData, title) => {
     // Extract potential hashtags from title
     const words = title.split(' ')
       .filter(word => word.length > 4)
-      .map(word => word.replace(/[^a-zA-Z0-9]/g, ''))
+      .map(word => word.replace(NON_ALPHANUMERIC_REGEX, ''))
       .slice(0, 2);
     
     words.forEach(word => hashtags.push('#' + word));